@@ -17,7 +17,6 @@ from __future__ import annotations
 import os
 from typing import Final, NoReturn
 
-import streamlit as st
 from streamlit import source_util
 from streamlit.deprecation_util import make_deprecated_name_warning
 from streamlit.errors import NoSessionContext, StreamlitAPIException
@@ -52,7 +51,7 @@ def stop() -> NoReturn:  # type: ignore[misc]
     if ctx and ctx.script_requests:
         ctx.script_requests.request_stop()
         # Force a yield point so the runner can stop
-        st.empty()
+        ctx.force_yield()
 
 
 @gather_metrics("rerun")
@@ -76,7 +75,7 @@ def rerun() -> NoReturn:  # type: ignore[misc]
             )
         )
         # Force a yield point so the runner can do the rerun
-        st.empty()
+        ctx.force_yield()
 
 
 @gather_metrics("experimental_rerun")
@@ -143,11 +142,11 @@ def switch_page(page: str) -> NoReturn:  # type: ignore[misc]
 
     main_script_directory = get_main_script_directory(ctx.main_script_path)
     requested_page = os.path.realpath(normalize_path_join(main_script_directory, page))
-    all_app_pages = source_util.get_pages(ctx.main_script_path).values()
-
-    matched_pages = [p for p in all_app_pages if p["script_path"] == requested_page]
+    matched_page = source_util.get_page_by_script_path(
+        ctx.main_script_path, requested_page
+    )
 
-    if len(matched_pages) == 0:
+    if matched_page is None:
         raise StreamlitAPIException(
             f"Could not find page: `{page}`. Must be the file path relative to the main script, from the directory: `{os.path.basename(main_script_directory)}`. Only the main app file and files in the `pages/` directory are supported."
         )
@@ -155,8 +154,8 @@ def switch_page(page: str) -> NoReturn:  # type: ignore[misc]
     ctx.script_requests.request_rerun(
         RerunData(
             query_string=ctx.query_string,
-            page_script_hash=matched_pages[0]["page_script_hash"],
+            page_script_hash=matched_page["page_script_hash"],
         )
     )
     # Force a yield point so the runner can do the rerun
-    st.empty()
+    ctx.force_yield()
@@ -690,18 +690,17 @@ class ButtonMixin:
         requested_page = os.path.realpath(
             normalize_path_join(main_script_directory, page)
         )
-        all_app_pages = source_util.get_pages(ctx_main_script).values()
+        page_data = source_util.get_page_by_script_path(
+            ctx_main_script, requested_page
+        )
 
         # Handle retrieving the page_script_hash & page
-        for page_data in all_app_pages:
-            full_path = page_data["script_path"]
+        if page_data is not None:
             page_name = page_data["page_name"]
-            if requested_page == full_path:
-                if label is None:
-                    page_link_proto.label = page_name.replace("_", " ")
-                page_link_proto.page_script_hash = page_data["page_script_hash"]
-                page_link_proto.page = page_name
-                break
+            if label is None:
+                page_link_proto.label = page_name.replace("_", " ")
+            page_link_proto.page_script_hash = page_data["page_script_hash"]
+            page_link_proto.page = page_name
 
         if page_link_proto.page_script_hash == "":
             raise StreamlitAPIException(
@@ -75,6 +75,9 @@ class ScriptRunContext:
     form_ids_this_run: set[str] = field(default_factory=set)
     cursors: dict[int, "streamlit.cursor.RunningCursor"] = field(default_factory=dict)
     script_requests: ScriptRequests | None = None
+    # Called by force_yield to let the ScriptRunner handle a pending STOP or
+    # RERUN request.
+    _yield_callback: Callable[[], None] | None = None
     current_fragment_id: str | None = None
     fragment_ids_this_run: set[str] | None = None
     # we allow only one dialog to be open at the same time
@@ -124,6 +127,16 @@ class ScriptRunContext:
     def on_script_start(self) -> None:
         self._has_script_started = True
 
+    def force_yield(self) -> None:
+        """Give the ScriptRunner a chance to handle a pending STOP or RERUN
+        request.
+
+        Unlike yielding by calling an `st.foo` command, this doesn't create a
+        DeltaGenerator or enqueue a ForwardMsg.
+        """
+        if self._yield_callback is not None:
+            self._yield_callback()
+
     def enqueue(self, msg: ForwardMsg) -> None:
         """Enqueue a ForwardMsg for this context's session."""
         if msg.HasField("page_config_changed") and not self._set_page_config_allowed:
@@ -287,6 +287,7 @@ class ScriptRunner:
             session_id=self._session_id,
             _enqueue=self._enqueue_forward_msg,
             script_requests=self._requests,
+            _yield_callback=self._maybe_handle_execution_control_request,
             query_string="",
             session_state=self._session_state,
             uploaded_file_mgr=self._uploaded_file_mgr,
@@ -429,7 +430,7 @@ class ScriptRunner:
             main_script_path = self._main_script_path
             pages = source_util.get_pages(main_script_path)
             # Safe because pages will at least contain the app's main page.
-            main_page_info = list(pages.values())[0]
+            main_page_info = next(iter(pages.values()))
             current_page_info = None
             uncaught_exception = None
 
@@ -441,13 +442,10 @@ class ScriptRunner:
                 # sent to the frontend. In this case, we choose the first script
                 # with a name matching the requested page name.
                 current_page_info = next(
-                    filter(
-                        # There seems to be this weird bug with mypy where it
-                        # thinks that p can be None (which is impossible given the
-                        # types of pages), so we add `p and` at the beginning of
-                        # the predicate to circumvent this.
-                        lambda p: p and (p["page_name"] == rerun_data.page_name),
-                        pages.values(),
+                    (
+                        p
+                        for p in pages.values()
+                        if p["page_name"] == rerun_data.page_name
                     ),
                     None,
                 )
@@ -14,10 +14,14 @@
 
 from __future__ import annotations
 
+import functools
+import operator
+import os
 import re
 import threading
+import time
 from pathlib import Path
-from typing import Any, Callable, Final, cast
+from typing import Callable, Final, NamedTuple
 
 from blinker import Signal
 
@@ -47,17 +51,27 @@ def open_python_file(filename: str):
 
 
 PAGE_FILENAME_REGEX = re.compile(r"([0-9]*)[_ -]*(.*)\.py")
+_UNDERSCORE_SPACE_RE = re.compile(r"[_ ]+")
 
 
 def page_sort_key(script_path: Path) -> tuple[float, str]:
-    matches = re.findall(PAGE_FILENAME_REGEX, script_path.name)
+    # NOTE: get_pages sorts with _page_filename_sort_key directly. This
+    # Path-based wrapper is kept for backwards compatibility.
+    key = _page_filename_sort_key(script_path.name)
 
     # Failing this assert should only be possible if script_path isn't a Python
     # file, which should never happen.
-    assert len(matches) > 0, f"{script_path} is not a Python file"
+    assert key is not None, f"{script_path} is not a Python file"
 
-    [(number, label)] = matches
-    label = label.lower()
+    return key
+
+
+def _page_filename_sort_key(filename: str) -> tuple[float, str] | None:
+    match = PAGE_FILENAME_REGEX.match(filename)
+    if match is None:
+        return None
+
+    number, label = match.group(1), match.group(2).lower()
 
     if number == "":
         return (float("inf"), label)
@@ -74,39 +88,107 @@ def page_icon_and_name(script_path: Path) -> tuple[str, str]:
     URL-encode them. To solve this, we only swap the underscores for spaces
     right before we render page names.
     """
-    extraction = re.search(PAGE_FILENAME_REGEX, script_path.name)
+    return _page_filename_icon_and_name(script_path.name)
+
+
+@functools.lru_cache(maxsize=512)
+def _page_filename_icon_and_name(filename: str) -> tuple[str, str]:
+    extraction = PAGE_FILENAME_REGEX.match(filename)
     if extraction is None:
         return "", ""
 
-    # This cast to Any+type annotation weirdness is done because
-    # cast(re.Match[str], ...) explodes at runtime since Python interprets it
-    # as an attempt to index into re.Match instead of as a type annotation.
-    extraction: re.Match[str] = cast(Any, extraction)
-
-    icon_and_name = re.sub(
-        r"[_ ]+", "_", extraction.group(2)
-    ).strip() or extraction.group(1)
+    icon_and_name = (
+        _UNDERSCORE_SPACE_RE.sub("_", extraction.group(2)).strip()
+        or extraction.group(1)
+    )
 
     return extract_leading_emoji(icon_and_name)
 
 
-_pages_cache_lock = threading.RLock()
+@functools.lru_cache(maxsize=512)
+def _md5_path(script_path_str: str) -> str:
+    """Return the page script hash for the given resolved script path.
+
+    The hash only depends on the path string, so it's safe to memoize across
+    invalidations of the pages cache.
+    """
+    return calc_md5(script_path_str)
+
+
+class _PagesIndex(NamedTuple):
+    """Lookup structures derived from a pages dict returned by get_pages."""
+
+    pages: dict[str, dict[str, str]]
+    by_script_path: dict[str, dict[str, str]]
+
+
+_pages_cache_lock = threading.Lock()
 _cached_pages: dict[str, dict[str, str]] | None = None
+# Derived from the pages dict it references, and rebuilt whenever get_pages
+# returns a different dict.
+_pages_index: _PagesIndex | None = None
+# The pages most recently computed by get_pages along with the main script path
+# and pages directory mtime they were computed from. Editing a page script
+# invalidates the pages cache without changing the set of pages, so this lets
+# get_pages skip rescanning the pages directory if its mtime hasn't changed.
+_last_pages_scan: tuple[str, int, dict[str, dict[str, str]]] | None = None
+_RACY_MTIME_WINDOW_NS: Final = 2_000_000_000
 _on_pages_changed = Signal(doc="Emitted when the pages directory is changed")
+# Editors often write several files in quick succession when saving, so we
+# coalesce the pages changed events fired within this window into one.
+_PAGES_CHANGED_DEBOUNCE_SECS: Final = 0.05
+_pages_changed_timer: threading.Timer | None = None
 
 
 def invalidate_pages_cache() -> None:
-    global _cached_pages
+    global _cached_pages, _pages_index, _pages_changed_timer
 
     _LOGGER.debug("Pages directory changed")
     with _pages_cache_lock:
         _cached_pages = None
+        _pages_index = None
+
+        if _pages_changed_timer is not None:
+            # A pages changed event is already scheduled and will be sent
+            # after this invalidation.
+            return
+
+        timer = threading.Timer(_PAGES_CHANGED_DEBOUNCE_SECS, _send_pages_changed)
+        timer.daemon = True
+        _pages_changed_timer = timer
+
+    timer.start()
+
+
+def _send_pages_changed() -> None:
+    global _pages_changed_timer
+
+    with _pages_cache_lock:
+        _pages_changed_timer = None
 
     _on_pages_changed.send()
 
 
+@functools.lru_cache(maxsize=32)
+def _main_script_and_pages_dir(main_script_path_str: str) -> tuple[Path, Path]:
+    """Return the main script path and its pages directory as Path objects.
+
+    The main script path doesn't change over the lifetime of a server, so we
+    avoid re-parsing it every time the pages cache is recomputed.
+    """
+    main_script_path = Path(main_script_path_str)
+    return main_script_path, main_script_path.parent / "pages"
+
+
+def _get_mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def get_pages(main_script_path_str: str) -> dict[str, dict[str, str]]:
-    global _cached_pages
+    global _cached_pages, _last_pages_scan
 
     # Avoid taking the lock if the pages cache hasn't been invalidated.
     pages = _cached_pages
@@ -116,12 +198,25 @@ def get_pages(main_script_path_str: str) -> dict[str, dict[str, str]]:
     with _pages_cache_lock:
         # The cache may have been repopulated while we were waiting to grab
         # the lock.
-        if _cached_pages is not None:
-            return _cached_pages
+        pages = _cached_pages
+        if pages is not None:
+            return pages
+
+        main_script_path, pages_dir = _main_script_and_pages_dir(main_script_path_str)
+        pages_dir_mtime_ns = _get_mtime_ns(pages_dir)
+
+        last_scan = _last_pages_scan
+        if (
+            pages_dir_mtime_ns is not None
+            and last_scan is not None
+            and last_scan[0] == main_script_path_str
+            and last_scan[1] == pages_dir_mtime_ns
+        ):
+            _cached_pages = last_scan[2]
+            return last_scan[2]
 
-        main_script_path = Path(main_script_path_str)
         main_page_icon, main_page_name = page_icon_and_name(main_script_path)
-        main_page_script_hash = calc_md5(main_script_path_str)
+        main_page_script_hash = _md5_path(main_script_path_str)
 
         # NOTE: We include the page_script_hash in the dict even though it is
         #       already used as the key because that occasionally makes things
@@ -135,20 +230,40 @@ def get_pages(main_script_path_str: str) -> dict[str, dict[str, str]]:
             }
         }
 
-        pages_dir = main_script_path.parent / "pages"
-        page_scripts = sorted(
-            [
-                f
-                for f in pages_dir.glob("*.py")
-                if not f.name.startswith(".") and not f.name == "__init__.py"
-            ],
-            key=page_sort_key,
-        )
-
-        for script_path in page_scripts:
-            script_path_str = str(script_path.resolve())
-            pi, pn = page_icon_and_name(script_path)
-            psh = calc_md5(script_path_str)
+        # Resolve the pages directory once rather than resolving every page
+        # script individually, which costs a realpath walk per file.
+        resolved_pages_dir = str(pages_dir.resolve())
+        # Compute each page's sort key once while scanning so that sorting
+        # doesn't need to call back into Python for every entry.
+        page_entries: list[tuple[tuple[float, str], os.DirEntry[str]]] = []
+        try:
+            with os.scandir(pages_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if (
+                        not name.endswith(".py")
+                        or name.startswith(".")
+                        or name == "__init__.py"
+                    ):
+                        continue
+
+                    sort_key = _page_filename_sort_key(name)
+                    if sort_key is not None:
+                        page_entries.append((sort_key, entry))
+        except OSError:
+            # Like Path.glob, treat a missing or unreadable pages directory as
+            # having no pages.
+            page_entries = []
+
+        page_entries.sort(key=operator.itemgetter(0))
+
+        for _, entry in page_entries:
+            if entry.is_symlink():
+                script_path_str = os.path.realpath(entry.path)
+            else:
+                script_path_str = os.path.join(resolved_pages_dir, entry.name)
+            pi, pn = _page_filename_icon_and_name(entry.name)
+            psh = _md5_path(script_path_str)
 
             pages[psh] = {
                 "page_script_hash": psh,
@@ -158,10 +273,41 @@ def get_pages(main_script_path_str: str) -> dict[str, dict[str, str]]:
             }
 
         _cached_pages = pages
+        # Filesystem timestamps can be coarse, so a file added shortly after
+        # this scan may not bump the pages directory mtime. Only trust the
+        # mtime once it's old enough that this can't happen.
+        if (
+            pages_dir_mtime_ns is not None
+            and time.time_ns() - pages_dir_mtime_ns > _RACY_MTIME_WINDOW_NS
+        ):
+            _last_pages_scan = (main_script_path_str, pages_dir_mtime_ns, pages)
 
         return pages
 
 
+def _get_pages_index(main_script_path_str: str) -> _PagesIndex:
+    global _pages_index
+
+    pages = get_pages(main_script_path_str)
+
+    index = _pages_index
+    if index is None or index.pages is not pages:
+        index = _PagesIndex(
+            pages=pages,
+            by_script_path={p["script_path"]: p for p in pages.values()},
+        )
+        _pages_index = index
+
+    return index
+
+
+def get_page_by_script_path(
+    main_script_path_str: str, script_path_str: str
+) -> dict[str, str] | None:
+    """Return the page whose resolved script path is script_path_str, if any."""
+    return _get_pages_index(main_script_path_str).by_script_path.get(script_path_str)
+
+
 def register_pages_changed_callback(
     callback: Callable[[str], None],
 ) -> Callable[[], None]:
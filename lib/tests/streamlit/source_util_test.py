@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -49,6 +50,10 @@ class PageHelperFunctionTests(unittest.TestCase):
 
         assert str(e.value) == f"{Path('/foo/bar/baz.rs')} is not a Python file"
 
+    def test_page_filename_sort_key(self):
+        assert source_util._page_filename_sort_key("01_bar.py") == (1.0, "bar")
+        assert source_util._page_filename_sort_key("baz.rs") is None
+
     @parameterized.expand(
         [
             # Test that the page number is removed as expected.
@@ -93,13 +98,50 @@ class PageHelperFunctionTests(unittest.TestCase):
     def test_page_icon_and_name(self, path_str, expected):
         assert source_util.page_icon_and_name(Path(path_str)) == expected
 
+    def test_md5_path(self):
+        assert source_util._md5_path("/foo/01_bar.py") == calc_md5("/foo/01_bar.py")
+
     @patch("streamlit.source_util._on_pages_changed", MagicMock())
     @patch("streamlit.source_util._cached_pages", new="Some pages")
-    def test_invalidate_pages_cache(self):
+    @patch("streamlit.source_util._pages_changed_timer", new=None)
+    @patch("streamlit.source_util.threading.Timer")
+    def test_invalidate_pages_cache(self, mock_timer):
         source_util.invalidate_pages_cache()
 
         assert source_util._cached_pages is None
+        mock_timer.assert_called_once_with(
+            source_util._PAGES_CHANGED_DEBOUNCE_SECS,
+            source_util._send_pages_changed,
+        )
+        mock_timer.return_value.start.assert_called_once()
+        source_util._on_pages_changed.send.assert_not_called()
+
+        # Simulate the timer firing.
+        source_util._send_pages_changed()
         source_util._on_pages_changed.send.assert_called_once()
+        assert source_util._pages_changed_timer is None
+
+    @patch("streamlit.source_util._on_pages_changed", MagicMock())
+    @patch("streamlit.source_util._cached_pages", new="Some pages")
+    @patch("streamlit.source_util._pages_changed_timer", new=None)
+    @patch("streamlit.source_util.threading.Timer")
+    def test_invalidate_pages_cache_coalesces_pages_changed_events(
+        self, mock_timer
+    ):
+        source_util.invalidate_pages_cache()
+        source_util.invalidate_pages_cache()
+        source_util.invalidate_pages_cache()
+
+        mock_timer.assert_called_once()
+        mock_timer.return_value.start.assert_called_once()
+
+        # Simulate the timer firing.
+        source_util._send_pages_changed()
+        source_util._on_pages_changed.send.assert_called_once()
+
+        # An invalidation after the event was sent schedules a new one.
+        source_util.invalidate_pages_cache()
+        assert mock_timer.call_count == 2
 
     @patch("streamlit.source_util._on_pages_changed", MagicMock())
     def test_register_pages_changed_callback(self):
@@ -182,3 +224,86 @@ def test_get_pages(tmpdir):
     # Assert address-equality to verify the cache is used the second time
     # get_pages is called.
     assert source_util.get_pages(main_script_path) is received_pages
+
+
+@patch("streamlit.source_util._cached_pages", new=None)
+def test_get_pages_without_pages_dir(tmpdir):
+    tmpdir.join("streamlit_app.py").write("")
+    main_script_path = str(tmpdir / "streamlit_app.py")
+
+    assert source_util.get_pages(main_script_path) == {
+        calc_md5(main_script_path): {
+            "page_script_hash": calc_md5(main_script_path),
+            "page_name": "streamlit_app",
+            "script_path": main_script_path,
+            "icon": "",
+        },
+    }
+
+
+@patch("streamlit.source_util._cached_pages", new=None)
+@patch("streamlit.source_util._pages_index", new=None)
+def test_get_page_by_script_path(tmpdir):
+    tmpdir.join("streamlit_app.py").write("")
+    pages_dir = tmpdir.mkdir("pages")
+    pages_dir.join("01-page.py").write("")
+
+    main_script_path = str(tmpdir / "streamlit_app.py")
+    page_script_path = str(pages_dir / "01-page.py")
+
+    page = source_util.get_page_by_script_path(main_script_path, page_script_path)
+    assert page is not None
+    assert page["page_script_hash"] == calc_md5(page_script_path)
+    assert page["page_name"] == "page"
+
+    main_page = source_util.get_page_by_script_path(
+        main_script_path, main_script_path
+    )
+    assert main_page is not None
+    assert main_page["page_name"] == "streamlit_app"
+
+    assert (
+        source_util.get_page_by_script_path(
+            main_script_path, str(pages_dir / "missing.py")
+        )
+        is None
+    )
+
+
+@patch("streamlit.source_util._cached_pages", new=None)
+@patch("streamlit.source_util._last_pages_scan", new=None)
+@patch("streamlit.source_util._on_pages_changed", MagicMock())
+@patch("streamlit.source_util._pages_changed_timer", new=None)
+@patch("streamlit.source_util.threading.Timer", MagicMock())
+def test_get_pages_skips_rescan_if_pages_dir_unchanged(tmpdir):
+    tmpdir.join("streamlit_app.py").write("")
+    pages_dir = tmpdir.mkdir("pages")
+    pages_dir.join("01-page.py").write("")
+    # Backdate the pages directory so that its mtime is trusted.
+    os.utime(pages_dir, ns=(0, 0))
+
+    main_script_path = str(tmpdir / "streamlit_app.py")
+    received_pages = source_util.get_pages(main_script_path)
+
+    # Editing a page invalidates the cache but doesn't change the pages dir
+    # mtime, so the previous scan is reused.
+    pages_dir.join("01-page.py").write("st.write('hi')")
+    source_util.invalidate_pages_cache()
+    assert source_util.get_pages(main_script_path) is received_pages
+
+    # Adding a page changes the pages dir mtime, so the pages dir is rescanned.
+    pages_dir.join("02-page.py").write("")
+    source_util.invalidate_pages_cache()
+    new_pages = source_util.get_pages(main_script_path)
+    assert new_pages is not received_pages
+    assert calc_md5(str(pages_dir / "02-page.py")) in new_pages
+
+
+@patch("streamlit.source_util._cached_pages", new=None)
+@patch("streamlit.source_util._last_pages_scan", new=None)
+def test_get_pages_does_not_trust_recent_pages_dir_mtime(tmpdir):
+    tmpdir.join("streamlit_app.py").write("")
+    tmpdir.mkdir("pages").join("01-page.py").write("")
+
+    source_util.get_pages(str(tmpdir / "streamlit_app.py"))
+    assert source_util._last_pages_scan is None
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+from unittest.mock import MagicMock
+
 import streamlit as st
 from streamlit.runtime.scriptrunner.script_requests import ScriptRequestType
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
@@ -22,3 +24,12 @@ class StopTest(DeltaGeneratorTestCase):
     def test_stop(self):
         st.stop()
         assert self.script_run_ctx.script_requests._state == ScriptRequestType.STOP
+
+    def test_stop_yields_without_enqueueing(self):
+        yield_callback = MagicMock()
+        self.script_run_ctx._yield_callback = yield_callback
+
+        st.stop()
+
+        yield_callback.assert_called_once()
+        assert self.get_all_deltas_from_queue() == []